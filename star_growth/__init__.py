@@ -3,6 +3,15 @@
 __version__ = "0.2.0"
 
 from .config import StarsAnimationConfig
-from .generator import generate_scrolling_stars
 
 __all__ = ["StarsAnimationConfig", "generate_scrolling_stars", "__version__"]
+
+
+def __getattr__(name):
+    # The generator pulls in Pillow, MoviePy and requests; only load it when
+    # it is actually used so `--help` and `--version` stay fast.
+    if name == "generate_scrolling_stars":
+        from .generator import generate_scrolling_stars
+
+        return generate_scrolling_stars
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
 import argparse
-from datetime import datetime, time, timezone
-from pathlib import Path
+import functools
+import os
+import re
+import sys
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Sequence
 
 from . import __version__
 from .config import StarsAnimationConfig
-from .generator import generate_scrolling_stars
 
+_UTC = timezone.utc
 
-def build_arg_parser() -> argparse.ArgumentParser:
+# ISO 8601 timestamps as datetime.fromisoformat reads them on every supported
+# Python: date, hour, optional minutes/seconds/fraction, then an optional Z or
+# +HH[:MM[:SS[.ffffff]]] offset. [0-9] keeps non-ASCII digits out.
+_ISO_RE = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})[Tt ]([0-9]{2})"
+    r"(?::([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,6}))?)?)?"
+    r"(?:(Z)|([+-])([0-9]{2})"
+    r"(?::?([0-9]{2})(?::?([0-9]{2})(?:\.([0-9]{1,6}))?)?)?)?"
+)
+_INVALID_DATE = "Invalid date '{}'. Use YYYY-MM-DD or a full ISO 8601 timestamp."
+# Offset from midnight to the last representable instant of that day
+_END_OF_DAY = timedelta(hours=23, minutes=59, seconds=59, microseconds=999999)
+
+
+def _build_arg_parser_uncached() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="star-growth",
         description="Turn your GitHub star growth into a scrolling MP4 or GIF.",
@@ -79,9 +96,10 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Easing curve for scroll progress",
     )
     parser.add_argument(
-        "-F", "--frames-dir", help="Directory to store intermediate frames")
+        "-F", "--frames-dir",
+        help="Directory for the frame PNGs saved by --keep-frames (default: a temporary directory)")
     parser.add_argument("-k", "--keep-frames", action="store_true",
-                        help="Keep frame PNGs after rendering")
+                        help="Save every rendered frame as a PNG")
     parser.add_argument(
         "-T", "--token", help="GitHub personal access token (or set GITHUB_TOKEN env var)")
     parser.add_argument(
@@ -100,7 +118,9 @@ def build_arg_parser() -> argparse.ArgumentParser:
         "-b", "--retry-backoff",
         type=float,
         default=2.0,
-        help="Base number of seconds to back off between retries",
+        help="Backoff factor in seconds: transient errors retry at once, then "
+             "after 2x, 4x, 8x... this value (capped at 120s); rate-limit "
+             "retries wait at least this value times the attempt number",
     )
     parser.add_argument(
         "-a", "--avatar-workers",
@@ -124,42 +144,142 @@ def build_arg_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: Optional[Sequence[str]] = None) -> str:
-    parser = build_arg_parser()
-    args = parser.parse_args(argv)
+@functools.lru_cache(maxsize=1)
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Return the shared CLI parser, building it on first use.
+
+    Parsing does not mutate the parser, so repeated ``main()`` calls (tests,
+    batch scripts) can reuse one instance instead of re-adding every option.
+    """
+
+    return _build_arg_parser_uncached()
 
-    def _parse_date(value: Optional[str], *, end: bool = False) -> Optional[datetime]:
-        if not value:
+
+# Free-form string options that need no type conversion or validation, so a
+# plain "flag value" pair can be mapped straight onto its destination.
+_FAST_OPTIONS = {
+    "-u": "owner", "--owner": "owner",
+    "-r": "repo", "--repo": "repo",
+    "-t": "title", "--title": "title",
+    "-o": "output", "--output": "output",
+    "-T": "token", "--token": "token",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_namespace() -> argparse.Namespace:
+    return build_arg_parser().parse_args([])
+
+
+def _fast_parse(argv: Sequence[str]) -> Optional[argparse.Namespace]:
+    """Parse the common ``--owner X --repo Y`` style invocation without argparse.
+
+    Returns ``None`` whenever ``argv`` contains anything beyond recognised
+    string options followed by a value, leaving argparse to handle help,
+    validation and error reporting.
+    """
+
+    if len(argv) % 2:
+        return None
+    overrides = {}
+    for flag, value in zip(argv[::2], argv[1::2]):
+        dest = _FAST_OPTIONS.get(flag)
+        if dest is None or value.startswith("-"):
             return None
-        original = value
-        try:
-            dt = datetime.fromisoformat(value)
-            full_day = len(value) <= 10
-        except ValueError:
-            if len(value) == 10:
-                dt = datetime.strptime(value, "%Y-%m-%d")
-                full_day = True
-            else:
-                parser.error(
-                    f"Invalid date '{value}'. Use YYYY-MM-DD or a full ISO 8601 timestamp."
-                )
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-        if full_day and end:
-            dt = dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return dt
+        overrides[dest] = value
+    return argparse.Namespace(**{**vars(_default_namespace()), **overrides})
+
+
+def _parse_date(
+    value: Optional[str],
+    *,
+    end: bool = False,
+    _datetime=datetime,
+    _utc=_UTC,
+    _end_of_day=_END_OF_DAY,
+    _fullmatch=_ISO_RE.fullmatch,
+) -> Optional[datetime]:
+    """Parse a ``--start-date``/``--end-date`` value into an aware UTC datetime.
+
+    Plain ``YYYY-MM-DD`` values cover the whole day, so with ``end=True`` they
+    resolve to the last microsecond of that day. Raises ``ValueError`` for
+    anything that is not a valid date or ISO 8601 timestamp.
+    """
+
+    # Module globals are bound as defaults so lookups are local-variable loads
+    if not value:
+        return None
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        year, month, day = value[:4], value[5:7], value[8:10]
+        # int() alone would also take signs, spaces and non-ASCII digits
+        if not (value.isascii() and year.isdigit() and month.isdigit()
+                and day.isdigit()):
+            raise ValueError(f"not a YYYY-MM-DD date: {value!r}")
+        dt = _datetime(int(year), int(month), int(day), tzinfo=_utc)
+        return dt + _end_of_day if end else dt
+
+    match = _fullmatch(value)
+    if not match:
+        raise ValueError(f"not an ISO 8601 timestamp: {value!r}")
+    (year, month, day, hour, minute, second, fraction,
+     _zulu, sign, off_hours, off_minutes, off_seconds, off_fraction) = match.groups()
+    tzinfo = _utc
+    if sign:
+        if int(off_minutes or 0) >= 60 or int(off_seconds or 0) >= 60:
+            raise ValueError(f"UTC offset out of range: {value!r}")
+        delta = timedelta(
+            hours=int(off_hours),
+            minutes=int(off_minutes or 0),
+            seconds=int(off_seconds or 0),
+            microseconds=int((off_fraction or "0").ljust(6, "0")),
+        )
+        # timezone() itself rejects offsets of 24 hours or more
+        tzinfo = timezone(-delta if sign == "-" else delta)
+    dt = _datetime(
+        int(year), int(month), int(day), int(hour), int(minute or 0),
+        int(second or 0), int((fraction or "0").ljust(6, "0")),
+        tzinfo=tzinfo,
+    )
+    return dt if tzinfo is _utc else dt.astimezone(_utc)
+
+
+def _build_version_parser() -> argparse.ArgumentParser:
+    """Minimal parser that only knows ``--version``.
+
+    ``--help`` still needs every option registered, but printing the version
+    does not, so it skips building the full parser.
+    """
+
+    parser = argparse.ArgumentParser(prog="star-growth", add_help=False)
+    parser.add_argument("--version", action="version",
+                        version=f"%(prog)s {__version__}")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> str:
+    if argv is None:
+        argv = sys.argv[1:]
+    if "--version" in argv and "-h" not in argv and "--help" not in argv:
+        _build_version_parser().parse_known_args(argv)
+
+    parser = build_arg_parser()
+    args = _fast_parse(argv) or parser.parse_args(argv)
 
     output_format = args.format.lower()
     output_arg = args.output
     if output_arg:
-        suffix = Path(output_arg).suffix.lower()
+        suffix = os.path.splitext(output_arg)[1].lower()
         if suffix in {".mp4", ".gif"}:
             output_format = suffix.lstrip(".")
 
-    start_dt = _parse_date(args.start_date, end=False)
-    end_dt = _parse_date(args.end_date, end=True)
+    try:
+        start_dt = _parse_date(args.start_date, end=False)
+    except ValueError:
+        parser.error(_INVALID_DATE.format(args.start_date))
+    try:
+        end_dt = _parse_date(args.end_date, end=True)
+    except ValueError:
+        parser.error(_INVALID_DATE.format(args.end_date))
     if start_dt and end_dt and start_dt > end_dt:
         parser.error("--start-date must be before or equal to --end-date")
 
@@ -191,6 +311,8 @@ def main(argv: Optional[Sequence[str]] = None) -> str:
 
     config = StarsAnimationConfig(**config_kwargs)
 
+    from .generator import generate_scrolling_stars
+
     return generate_scrolling_stars(config)
 
 
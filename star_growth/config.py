@@ -2,19 +2,27 @@ from __future__ import annotations
 
 import os
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass(slots=True)
+_UTC = timezone.utc
+
+
+@dataclass(frozen=True)
 class StarsAnimationConfig:
-    """Runtime configuration for rendering a star growth animation."""
+    """Runtime configuration for rendering a star growth animation.
+
+    Instances are immutable and hashable; use ``dataclasses.replace`` to
+    derive a variant.
+    """
 
     owner: str = "Esubaalew"
     repo: str = "run"
     title: Optional[str] = None
-    output: str = "star_growth.mp4"
+    output: str | os.PathLike[str] = "star_growth.mp4"
     output_format: str = "mp4"
     fps: int = 24
     duration_seconds: float = 8.0
@@ -33,44 +41,72 @@ class StarsAnimationConfig:
     show_progress: bool = True
     start_datetime: Optional[datetime] = None
     end_datetime: Optional[datetime] = None
+    _start_at_utc: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False)
+    _end_at_utc: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False)
+    start_epoch: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False)
+    end_epoch: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False)
 
-    def resolved_frames_dir(self) -> str:
-        """Directory to render frame images to, creating it if necessary."""
+    def __post_init__(self) -> None:
+        # Frozen dataclass: normalise in place via object.__setattr__
+        object.__setattr__(self, "avatar_workers", max(1, self.avatar_workers))
+        fmt = (self.output_format or "mp4").lower()
+        object.__setattr__(self, "output_format", "gif" if fmt == "gif" else "mp4")
+        object.__setattr__(self, "_start_at_utc", self._as_utc(self.start_datetime))
+        object.__setattr__(self, "_end_at_utc", self._as_utc(self.end_datetime))
+        # POSIX seconds for cheap float comparisons when filtering stargazers
+        if self._start_at_utc is not None:
+            object.__setattr__(self, "start_epoch", self._start_at_utc.timestamp())
+        if self._end_at_utc is not None:
+            object.__setattr__(self, "end_epoch", self._end_at_utc.timestamp())
+
+    @cached_property
+    def frames_directory(self) -> str:
+        """Directory to render frame images to, created on first access."""
 
         if self.frames_dir:
             os.makedirs(self.frames_dir, exist_ok=True)
             return self.frames_dir
         return tempfile.mkdtemp(prefix="star_growth_frames_")
 
-    @property
+    def resolved_frames_dir(self) -> str:
+        """Directory to render frame images to, creating it if necessary."""
+
+        return self.frames_directory
+
+    @cached_property
     def repo_label(self) -> str:
         return self.title or f"{self.owner}/{self.repo}"
 
-    @property
+    @cached_property
     def auth_token(self) -> Optional[str]:
         return self.token or os.getenv("GITHUB_TOKEN")
 
     @property
     def avatar_worker_count(self) -> int:
-        return max(1, self.avatar_workers)
+        return self.avatar_workers
 
     @property
     def normalized_output_format(self) -> str:
-        fmt = (self.output_format or "mp4").lower()
-        return "gif" if fmt == "gif" else "mp4"
+        return self.output_format
 
     @staticmethod
     def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
         if dt is None:
             return None
         if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+            return dt.replace(tzinfo=_UTC)
+        if dt.tzinfo is _UTC:
+            return dt
+        return dt.astimezone(_UTC)
 
     @property
     def start_at_utc(self) -> Optional[datetime]:
-        return self._as_utc(self.start_datetime)
+        return self._start_at_utc
 
     @property
     def end_at_utc(self) -> Optional[datetime]:
-        return self._as_utc(self.end_datetime)
+        return self._end_at_utc
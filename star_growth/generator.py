@@ -4,13 +4,19 @@ import io
 import math
 import os
 import shutil
+import warnings
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from typing import Dict, List, Sequence
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, TypeVar
 from pathlib import Path
+from urllib.parse import urlparse
 
+import imageio_ffmpeg
+import numpy as np
 import requests
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from requests.adapters import HTTPAdapter
 from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 
 try:
@@ -36,34 +42,65 @@ AVATAR_DIAMETER = 60
 # Palette pulled from screenshot cues
 BG_TOP = (8, 12, 22)
 BG_BOTTOM = (22, 27, 40)
-CARD_BG = (255, 255, 255, 248)
-CARD_BORDER = (233, 237, 243, 255)
-DIVIDER_COLOR = (232, 235, 240, 255)
-LINK_COLOR = (22, 111, 227, 255)
-TEXT_PRIMARY = (33, 38, 45, 255)
-TEXT_SECONDARY = (114, 121, 133, 255)
-BUTTON_BG = (249, 250, 252, 255)
-BUTTON_BORDER = (214, 221, 229, 255)
-STAR_ICON_COLOR = (240, 176, 0, 255)
-AVATAR_PLACEHOLDER = (236, 239, 244, 255)
+CARD_BG = (255, 255, 255)
+CARD_BORDER = (233, 237, 243)
+DIVIDER_COLOR = (232, 235, 240)
+LINK_COLOR = (22, 111, 227)
+TEXT_PRIMARY = (33, 38, 45)
+TEXT_SECONDARY = (114, 121, 133)
+BUTTON_BG = (249, 250, 252)
+BUTTON_BORDER = (214, 221, 229)
+STAR_ICON_COLOR = (240, 176, 0)
+AVATAR_PLACEHOLDER = (236, 239, 244)
 DEFAULT_OUTPUT_NAME = "star_growth.mp4"
 DEFAULT_GIF_OUTPUT_NAME = "star_growth.gif"
 
+_T = TypeVar("_T")
+# Sentinel for an exhausted iterator in _ordered_map
+_DONE = object()
+
+
+def _gradient_rows(height, top_color, bottom_color):
+    ratio = np.arange(height, dtype=np.float64)
+    if height > 1:
+        ratio /= height - 1
+    top = np.asarray(top_color[:3], dtype=np.float64)
+    bottom = np.asarray(bottom_color[:3], dtype=np.float64)
+    # One RGB value per row; truncation matches the previous int() rounding
+    return (top + (bottom - top) * ratio[:, None]).astype(np.uint8)
+
 
 def vertical_gradient(size, top_color, bottom_color):
     width, height = size
     if height <= 0:
         return Image.new("RGBA", size, top_color + (255,))
-    data = []
-    for y in range(height):
-        ratio = y / (height - 1) if height > 1 else 0
-        r = int(top_color[0] + (bottom_color[0] - top_color[0]) * ratio)
-        g = int(top_color[1] + (bottom_color[1] - top_color[1]) * ratio)
-        b = int(top_color[2] + (bottom_color[2] - top_color[2]) * ratio)
-        data.extend([(r, g, b, 255)] * width)
-    gradient = Image.new("RGBA", size)
-    gradient.putdata(data)
-    return gradient
+    data = np.empty((height, width, 4), dtype=np.uint8)
+    data[..., :3] = _gradient_rows(height, top_color, bottom_color)[:, None, :]
+    data[..., 3] = 255
+    return Image.fromarray(data)
+
+
+def vignette_gradient(size, top_color, bottom_color):
+    """Vertical gradient darkened by the background vignette, in one pass.
+
+    Equivalent to compositing black at alpha 110 over the gradient, except
+    inside a centred ellipse spanning 180% x 220% of the canvas, where the
+    alpha drops to 30.
+    """
+
+    width, height = size
+    if height <= 0 or width <= 0:
+        return vertical_gradient(size, top_color, bottom_color)
+    rows = _gradient_rows(height, top_color, bottom_color).astype(np.uint16)
+    # Pixel centres normalised by the ellipse semi-axes
+    ys = (np.arange(height) + 0.5 - height / 2) / (1.1 * height)
+    xs = (np.arange(width) + 0.5 - width / 2) / (0.9 * width)
+    inside = ys[:, None] ** 2 + xs[None, :] ** 2 <= 1
+    keep = np.where(inside, 255 - 30, 255 - 110).astype(np.uint16)
+    data = np.empty((height, width, 4), dtype=np.uint8)
+    data[..., :3] = (rows[:, None, :] * keep[..., None] + 127) // 255
+    data[..., 3] = 255
+    return Image.fromarray(data)
 
 
 def draw_star_shape(draw_obj, center, radius, fill):
@@ -95,11 +132,11 @@ def draw_text_chain(draw_obj, xy, segments):
                 x += len(text) * 8
 
 
-def _download_avatar(url: str, timeout: float) -> Image.Image | None:
+def _download_avatar(session: requests.Session, url: str, timeout: float) -> Image.Image | None:
     if not url:
         return None
     try:
-        response = requests.get(url, timeout=timeout)
+        response = session.get(url, timeout=timeout)
         response.raise_for_status()
         return Image.open(io.BytesIO(response.content)).convert("RGBA")
     except Exception:
@@ -108,36 +145,50 @@ def _download_avatar(url: str, timeout: float) -> Image.Image | None:
 
 def prefetch_avatars(urls: Sequence[str], config: StarsAnimationConfig) -> Dict[str, Image.Image | None]:
     cache: Dict[str, Image.Image | None] = {}
-    unique_urls = [url for url in dict.fromkeys(urls) if url]
+    seen = set()
+    unique_urls = [
+        url for url in urls if url and not (url in seen or seen.add(url))]
     if not unique_urls:
         return cache
+    # Submit same-host URLs back to back so their downloads share the pooled
+    # connections for that host; the sort is stable within a host
+    unique_urls.sort(key=lambda url: urlparse(url).netloc)
 
     timeout = config.request_timeout
     workers = config.avatar_worker_count
 
-    if workers <= 1 or len(unique_urls) == 1:
-        for url in unique_urls:
-            cache[url] = _download_avatar(url, timeout)
-        return cache
-
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_map = {executor.submit(
-            _download_avatar, url, timeout): url for url in unique_urls}
-        for future in as_completed(future_map):
-            url = future_map[future]
-            try:
-                cache[url] = future.result()
-            except Exception as exc:
-                print(f"Warning: avatar fetch failed for {url}: {exc}")
-                cache[url] = None
+    # One pooled session so avatar downloads reuse connections and TLS
+    # sessions instead of opening a new one per URL
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        session.mount("https://", adapter)
+        # Avatars are already-compressed images; skip transfer encoding
+        session.headers["Accept-Encoding"] = "identity"
+
+        if workers <= 1 or len(unique_urls) == 1:
+            for url in unique_urls:
+                cache[url] = _download_avatar(session, url, timeout)
+            return cache
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_map = {executor.submit(
+                _download_avatar, session, url, timeout): url for url in unique_urls}
+            for future in as_completed(future_map):
+                url = future_map[future]
+                try:
+                    cache[url] = future.result()
+                except Exception as exc:
+                    print(f"Warning: avatar fetch failed for {url}: {exc}")
+                    cache[url] = None
     return cache
 
 
-def _is_directory_hint(raw_path: str) -> bool:
-    if raw_path.endswith(os.sep):
+def _is_directory_hint(raw_path: str | os.PathLike[str]) -> bool:
+    # A trailing separator only survives in plain strings (e.g. CLI input)
+    if isinstance(raw_path, str) and raw_path.endswith(os.sep):
         return True
     try:
-        return Path(raw_path).expanduser().exists() and Path(raw_path).is_dir()
+        return Path(raw_path).expanduser().is_dir()
     except Exception:
         return False
 
@@ -166,7 +217,15 @@ def _unique_output_path(base_path: Path) -> Path:
     return candidate
 
 
-def resolve_output_path(config: StarsAnimationConfig) -> Path:
+def resolve_output_path(
+    config: StarsAnimationConfig, *, directory_hint: bool = False
+) -> Path:
+    """Return a fresh output file path for ``config.output``.
+
+    Pass ``directory_hint=True`` to treat the output as a directory even when
+    it does not exist yet; the default file name is then placed inside it.
+    """
+
     desired_format = config.normalized_output_format
     default_name = (
         DEFAULT_OUTPUT_NAME if desired_format == "mp4" else DEFAULT_GIF_OUTPUT_NAME
@@ -175,7 +234,7 @@ def resolve_output_path(config: StarsAnimationConfig) -> Path:
     raw = config.output or default_name
     path = Path(raw).expanduser()
 
-    if _is_directory_hint(raw):
+    if directory_hint or _is_directory_hint(raw):
         path = path / default_name
     elif not path.suffix:
         path = _ensure_extension(path, f".{desired_format}")
@@ -190,7 +249,6 @@ def resolve_output_path(config: StarsAnimationConfig) -> Path:
     if resolved_format == "gif" and path.name == DEFAULT_OUTPUT_NAME:
         path = path.with_name(DEFAULT_GIF_OUTPUT_NAME)
 
-    config.output_format = resolved_format
     parent = path.parent if str(path.parent) else Path(".")
     os.makedirs(parent, exist_ok=True)
     return _unique_output_path(path)
@@ -203,6 +261,17 @@ def _final_star_count(current_stars: int) -> int:
 def _parse_github_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
+    # GitHub always sends "YYYY-MM-DDTHH:MM:SSZ"; slice that shape directly
+    if len(value) == 20 and value[19] == "Z" and value[10] == "T" \
+            and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            return None
     try:
         return datetime.fromisoformat(value.replace("Z", "+00:00"))
     except Exception:
@@ -211,23 +280,43 @@ def _parse_github_timestamp(value: str | None) -> datetime | None:
 
 def _filter_stargazers_by_date(
     stargazers: Sequence[dict],
-    start_dt: datetime | None,
-    end_dt: datetime | None,
+    start_epoch: float | None,
+    end_epoch: float | None,
 ) -> List[dict]:
-    if not start_dt and not end_dt:
+    if start_epoch is None and end_epoch is None:
         return list(stargazers)
 
+    raw = [sg.get("starred_at") or "" for sg in stargazers]
+    try:
+        # Parse every timestamp in one NumPy call (GitHub's trailing Z means
+        # UTC, which is what datetime64 assumes). Anything it cannot parse
+        # cleanly, including explicit offsets it would only warn about,
+        # falls back to the per-row loop below.
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            stamps = np.array(
+                [value[:-1] if value.endswith("Z") else value for value in raw],
+                dtype="datetime64[us]",
+            )
+    except (ValueError, Warning):
+        pass
+    else:
+        keep = ~np.isnat(stamps)
+        if start_epoch is not None:
+            keep &= stamps >= np.datetime64(round(start_epoch * 1_000_000), "us")
+        if end_epoch is not None:
+            keep &= stamps <= np.datetime64(round(end_epoch * 1_000_000), "us")
+        return [sg for sg, kept in zip(stargazers, keep.tolist()) if kept]
+
     filtered: List[dict] = []
     for sg in stargazers:
-        ts = _parse_github_timestamp(sg.get("starred_at"))
-        if ts is None:
-            if start_dt or end_dt:
-                continue
-            filtered.append(sg)
+        parsed = _parse_github_timestamp(sg.get("starred_at"))
+        if parsed is None:
             continue
-        if start_dt and ts < start_dt:
+        ts = parsed.timestamp()
+        if start_epoch is not None and ts < start_epoch:
             continue
-        if end_dt and ts > end_dt:
+        if end_epoch is not None and ts > end_epoch:
             continue
         filtered.append(sg)
     return filtered
@@ -240,11 +329,8 @@ def build_entries(stargazers: Sequence[dict], current_stars: int, config: StarsA
         login = sg.get("login") or "unknown"
         starred_at = sg.get("starred_at")
         if starred_at:
-            try:
-                dt = datetime.fromisoformat(starred_at.replace("Z", "+00:00"))
-                date_str = dt.strftime("%b %d, %Y")
-            except Exception:
-                date_str = starred_at
+            dt = _parse_github_timestamp(starred_at)
+            date_str = dt.strftime("%b %d, %Y") if dt else starred_at
         else:
             date_str = ""
         if current_stars > 0:
@@ -277,17 +363,74 @@ def _fallback_entries(config: StarsAnimationConfig) -> tuple[int, List[dict]]:
 
 
 def ease_value(name: str, t: float) -> float:
+    """Ease ``t`` in [0, 1]; also works elementwise on NumPy arrays."""
+
     if name == "linear":
         return t
     return 1 - (1 - t) ** 2
 
 
+def _ordered_map(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[_T], np.ndarray],
+    items: Iterable[_T],
+    window: int,
+) -> Iterator[np.ndarray]:
+    """Yield ``fn(item)`` for each item in order with at most ``window`` in flight.
+
+    Unlike ``executor.map`` this does not queue every call up front, so a slow
+    consumer such as the encoder bounds how many frames sit in memory. Items
+    are pulled lazily on the calling thread, just before they are submitted.
+    """
+
+    pending = deque()
+    items = iter(items)
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                item = next(items, _DONE)
+                if item is _DONE:
+                    exhausted = True
+                else:
+                    pending.append(executor.submit(fn, item))
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _write_mp4(path: Path, frames: Iterable[np.ndarray], size, fps: int) -> None:
+    """Pipe raw RGB frames straight into an ffmpeg libx264 encoder.
+
+    Like MoviePy's writer, even-sized videos use yuv420p and odd sizes fall
+    back to yuv444p, so frames are never rescaled to a different size.
+    """
+
+    even = size[0] % 2 == 0 and size[1] % 2 == 0
+    writer = imageio_ffmpeg.write_frames(
+        str(path),
+        size,
+        pix_fmt_out="yuv420p" if even else "yuv444p",
+        fps=fps,
+        codec="libx264",
+        # Leave x264 on its default CRF, as MoviePy's writer did
+        quality=None,
+        # Never let imageio-ffmpeg resize to a macroblock multiple
+        macro_block_size=1,
+    )
+    writer.send(None)
+    try:
+        for frame in frames:
+            writer.send(frame)
+    finally:
+        writer.close()
+
+
 def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
-    frames_dir = config.resolved_frames_dir()
-    os.makedirs(frames_dir, exist_ok=True)
-    frame_files: List[str] = []
     session = requests.Session()
-    created_temp_dir = config.frames_dir is None
     desired_default = (
         DEFAULT_OUTPUT_NAME
         if config.normalized_output_format == "mp4"
@@ -305,7 +448,7 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
             current_stars, stargazers = _fallback_entries(config)
 
         stargazers = _filter_stargazers_by_date(
-            stargazers, config.start_at_utc, config.end_at_utc
+            stargazers, config.start_epoch, config.end_epoch
         )
         entries = build_entries(stargazers, current_stars, config)
         num_entries = len(entries) or 1
@@ -353,15 +496,7 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
             "canvas_height": canvas_height,
         }
 
-        tall = vertical_gradient((width, canvas_height), BG_TOP, BG_BOTTOM)
-        vignette = Image.new("RGBA", (width, canvas_height), (0, 0, 0, 0))
-        vig_draw = ImageDraw.Draw(vignette)
-        vig_draw.rectangle([0, 0, width, canvas_height], fill=(0, 0, 0, 110))
-        vig_draw.ellipse(
-            [-width * 0.4, -canvas_height * 0.6, width * 1.4, canvas_height * 1.6],
-            fill=(0, 0, 0, 30),
-        )
-        tall = Image.alpha_composite(tall, vignette)
+        tall = vignette_gradient((width, canvas_height), BG_TOP, BG_BOTTOM)
 
         shadow = Image.new("RGBA", (width, canvas_height), (0, 0, 0, 0))
         shadow_draw = ImageDraw.Draw(shadow)
@@ -377,7 +512,9 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
         except Exception:
             shadow_draw.rectangle(shadow_box, fill=(8, 12, 24, 140))
         shadow = shadow.filter(ImageFilter.GaussianBlur(18))
-        tall = Image.alpha_composite(tall, shadow)
+        # Only the shadow needs alpha; everything drawn after it is opaque, so
+        # the rest of the canvas is plain RGB
+        tall = Image.alpha_composite(tall, shadow).convert("RGB")
 
         draw = ImageDraw.Draw(tall)
         try:
@@ -426,26 +563,25 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
             font_initials = ImageFont.load_default()
 
         repo_label = config.repo_label
+        if "/" in repo_label:
+            owner_text, repo_text = repo_label.split("/", 1)
+        else:
+            owner_text, repo_text = repo_label, ""
+        # The title never changes between frames, so measure it once
+        if hasattr(draw, "textlength"):
+            owner_width = draw.textlength(owner_text, font=font_title_link)
+            slash_width = draw.textlength(" / ", font=font_title_link)
+        else:
+            owner_width = len(owner_text) * 16
+            slash_width = len(" / ") * 10
 
         def render_header(draw_obj, layout_map, star_count):
             left = layout_map["inner_left"]
             title_y = layout_map["header_title_y"]
             btn_left, btn_top, btn_right, btn_bottom = layout_map["button_rect"]
 
-            if "/" in repo_label:
-                owner_text, repo_text = repo_label.split("/", 1)
-            else:
-                owner_text, repo_text = repo_label, ""
-
             draw_obj.text((left, title_y), owner_text,
                           font=font_title_link, fill=LINK_COLOR)
-            if hasattr(draw_obj, "textlength"):
-                owner_width = draw_obj.textlength(
-                    owner_text, font=font_title_link)
-                slash_width = draw_obj.textlength(" / ", font=font_title_link)
-            else:
-                owner_width = len(owner_text) * 16
-                slash_width = len(" / ") * 10
 
             slash_x = left + owner_width
             if repo_text:
@@ -496,6 +632,30 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
 
         avatar_cache = prefetch_avatars(
             [entry.get("avatar_url") for entry in entries], config)
+        avatar_size = (AVATAR_DIAMETER, AVATAR_DIAMETER)
+        circle_mask = Image.new("L", avatar_size, 0)
+        ImageDraw.Draw(circle_mask).ellipse(
+            [0, 0, AVATAR_DIAMETER, AVATAR_DIAMETER], fill=255)
+        # Circular avatar tiles keyed by URL, so repeat stargazers reuse them
+        avatar_tiles: Dict[str, Image.Image] = {}
+
+        def avatar_tile(url, avatar_img):
+            tile = avatar_tiles.get(url)
+            if tile is None:
+                tile = Image.new("RGBA", avatar_size, (0, 0, 0, 0))
+                resized = avatar_img.resize(
+                    avatar_size, Image.Resampling.BILINEAR)
+                tile.paste(resized, (0, 0), circle_mask)
+                avatar_tiles[url] = tile
+            return tile
+
+        rank_label = "Star"
+        try:
+            label_bbox = draw.textbbox((0, 0), rank_label, font=font_rank_label)
+            rank_label_w = label_bbox[2] - label_bbox[0]
+        except Exception:
+            rank_label_w = len(rank_label) * 8
+
         for idx, entry in enumerate(entries):
             row_top = rows_start_y + idx * entry_height
             row_bottom = row_top + entry_height
@@ -505,22 +665,16 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
 
             avatar_x = inner_left
             avatar_y = row_top + (entry_height - AVATAR_DIAMETER) // 2
-            avatar_container = Image.new(
-                "RGBA", (AVATAR_DIAMETER, AVATAR_DIAMETER), (0, 0, 0, 0))
-            full_mask = Image.new("L", (AVATAR_DIAMETER, AVATAR_DIAMETER), 0)
-            mask_draw = ImageDraw.Draw(full_mask)
-            mask_draw.ellipse(
-                [0, 0, AVATAR_DIAMETER, AVATAR_DIAMETER], fill=255)
-
             avatar_url = entry.get("avatar_url")
             avatar_img = avatar_cache.get(avatar_url) if avatar_url else None
             if avatar_img:
-                resized = avatar_img.resize((AVATAR_DIAMETER, AVATAR_DIAMETER))
-                avatar_container.paste(resized, (0, 0), full_mask)
+                avatar_container = avatar_tile(avatar_url, avatar_img)
             else:
+                avatar_container = Image.new(
+                    "RGBA", avatar_size, (0, 0, 0, 0))
                 placeholder = Image.new(
-                    "RGBA", (AVATAR_DIAMETER, AVATAR_DIAMETER), AVATAR_PLACEHOLDER)
-                avatar_container.paste(placeholder, (0, 0), full_mask)
+                    "RGBA", avatar_size, AVATAR_PLACEHOLDER)
+                avatar_container.paste(placeholder, (0, 0), circle_mask)
                 initials = (entry["login"][:1] or "?").upper()
                 initials_draw = ImageDraw.Draw(avatar_container)
                 try:
@@ -555,15 +709,8 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
                     (f" on {entry['date']}", font_entry_meta, TEXT_SECONDARY))
             draw_text_chain(draw, (name_x, name_y + 32), subtitle_segments)
 
-            rank_label = "Star"
             rank_text = f"#{entry['rank']:,}"
-            try:
-                label_bbox = draw.textbbox(
-                    (0, 0), rank_label, font=font_rank_label)
-                label_w = label_bbox[2] - label_bbox[0]
-            except Exception:
-                label_w = len(rank_label) * 8
-            label_x = inner_right - label_w
+            label_x = inner_right - rank_label_w
             label_y = row_top + 8
             draw.text((label_x, label_y), rank_label,
                       font=font_rank_label, fill=TEXT_SECONDARY)
@@ -579,7 +726,10 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
             draw.text((rank_x, rank_y), rank_text,
                       font=font_rank_value, fill=TEXT_PRIMARY)
 
-        header_base = tall.crop((0, 0, width, layout["header_height"]))
+        # Draw headers on an RGB band so each layer is frame-ready as is. The
+        # band never extends past the viewport, so frames need no clamping.
+        overlay_height = min(layout["header_height"], viewport_height)
+        header_base = tall.crop((0, 0, width, overlay_height))
 
         def build_header_layer(star_count):
             layer = header_base.copy()
@@ -587,57 +737,124 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
             render_header(layer_draw, layout, star_count)
             return layer
 
+        # The eased count never goes back down, so equal counts are always
+        # adjacent; keep just the latest header band instead of one per count
+        last_count = None
+        last_pixels = None
+
+        def header_pixels(star_count):
+            nonlocal last_count, last_pixels
+            if star_count != last_count:
+                last_count = star_count
+                last_pixels = np.asarray(build_header_layer(star_count))
+            return last_pixels
+
+        # Read-only RGB pixels of the whole static canvas; frames are slices
+        tall_arr = np.asarray(tall)
+        if tall_arr.shape[0] < viewport_height:
+            # Match Image.crop, which pads short canvases with black
+            padded = np.zeros((viewport_height, width, 3), dtype=np.uint8)
+            padded[: tall_arr.shape[0]] = tall_arr
+            tall_arr = padded
+
         start_y = max(0, layout["canvas_height"] - viewport_height)
         end_y = 0
         frame_count = max(1, int(round(fps * duration_seconds)))
 
+        # Scroll offset and header star count for every frame, computed as
+        # whole arrays; float64 keeps the values identical to scalar math
+        if frame_count > 1:
+            progress = np.arange(frame_count, dtype=np.float64) / (frame_count - 1)
+        else:
+            progress = np.ones(1, dtype=np.float64)
+        eased = ease_value(easing_name, progress)
+        scroll_arr = (start_y + (end_y - start_y) * eased).astype(np.int64)
+        # np.rint rounds half to even, like the built-in round()
+        count_arr = np.rint(
+            start_stars + (end_stars - start_stars) * eased).astype(np.int64)
+        schedule = list(zip(scroll_arr.tolist(), count_arr.tolist()))
+
+        # The eased curve flattens near its ends, so neighbouring frames often
+        # share both values and are pixel-identical; render each run once
+        changed = np.ones(frame_count, dtype=bool)
+        changed[1:] = (scroll_arr[1:] != scroll_arr[:-1]) | (
+            count_arr[1:] != count_arr[:-1])
+        run_starts = np.flatnonzero(changed)
+        run_lengths = np.diff(np.append(run_starts, frame_count))
+        runs = list(zip(run_starts.tolist(), run_lengths.tolist()))
+
+        # Frames stay in memory; PNGs are only written when asked to keep them
+        frames_dir = None if config.cleanup_frames else config.frames_directory
+
+        def frame_jobs():
+            # Pulled by _ordered_map on this thread as runs are submitted.
+            # FreeType fonts are not safe to share across threads, so headers
+            # are drawn here; the workers only copy pixels and encode PNGs.
+            for frame_idx, run_length in runs:
+                scroll_y, animated_count = schedule[frame_idx]
+                yield (frame_idx, run_length, scroll_y,
+                       header_pixels(animated_count))
+
+        def render_frame(job):
+            frame_idx, run_length, scroll_y, header_arr = job
+            # Write every pixel exactly once: header band, then the rows of
+            # the read-only canvas visible below it
+            frame_arr = np.empty((viewport_height, width, 3), dtype=np.uint8)
+            frame_arr[:overlay_height] = header_arr
+            frame_arr[overlay_height:] = tall_arr[
+                scroll_y + overlay_height: scroll_y + viewport_height]
+            if frames_dir is not None:
+                # Debug output only: favour encode speed over file size
+                first_png = os.path.join(frames_dir, f"frame_{frame_idx:04d}.png")
+                Image.fromarray(frame_arr).save(first_png, compress_level=1)
+                for dup_idx in range(frame_idx + 1, frame_idx + run_length):
+                    shutil.copyfile(first_png, os.path.join(
+                        frames_dir, f"frame_{dup_idx:04d}.png"))
+            return frame_arr
+
+        suffix = final_output_path.suffix.lower()
+        print("Building animation with", frame_count, "frames...")
         use_progress = bool(config.show_progress and tqdm and frame_count > 1)
-        iterator = (
-            tqdm(
-                range(frame_count),
-                total=frame_count,
-                desc="Rendering frames",
-                unit="frame",
-                leave=False,
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # NumPy copies and PNG encoding release the GIL, so workers overlap;
+            # the window keeps them only a couple of frames ahead of the encoder
+            rendered = _ordered_map(
+                executor, render_frame, frame_jobs(), window=workers * 2)
+            # Repeat each run's array by reference; nothing is re-rendered
+            all_frames = (
+                frame
+                for (_, run_length), frame in zip(runs, rendered)
+                for _ in range(run_length)
             )
-            if use_progress
-            else range(frame_count)
-        )
-
-        try:
-            for frame_idx in iterator:
-                progress = frame_idx / \
-                    (frame_count - 1) if frame_count > 1 else 1.0
-                eased = ease_value(easing_name, progress)
-                scroll_y = int(start_y + (end_y - start_y) * eased)
-                frame = tall.crop(
-                    (0, scroll_y, width, scroll_y + viewport_height))
-                fimg = frame.copy()
-                animated_count = int(
-                    round(start_stars + (end_stars - start_stars) * eased))
-                header_overlay = build_header_layer(animated_count)
-                overlay_height = header_overlay.height
-                if overlay_height > viewport_height:
-                    overlay_slice = header_overlay.crop(
-                        (0, 0, width, viewport_height))
+            iterator = (
+                tqdm(
+                    all_frames,
+                    total=frame_count,
+                    desc="Rendering frames",
+                    unit="frame",
+                    leave=False,
+                )
+                if use_progress
+                else all_frames
+            )
+            try:
+                if suffix == ".gif":
+                    frames = list(iterator)
+                    clip = ImageSequenceClip(frames, fps=fps)
+                    clip.write_gif(str(final_output_path), fps=fps, loop=True)
+                    clip.close()
                 else:
-                    overlay_slice = header_overlay
-                fimg.paste(overlay_slice, (0, 0))
-                fname = os.path.join(frames_dir, f"frame_{frame_idx:04d}.png")
-                fimg.convert("RGB").save(fname)
-                frame_files.append(fname)
-        finally:
-            if use_progress and hasattr(iterator, "close"):
-                iterator.close()
-
-        print("Building animation with", len(frame_files), "frames...")
-        clip = ImageSequenceClip(frame_files, fps=fps)
-        suffix = final_output_path.suffix.lower()
-        if suffix == ".gif":
-            clip.write_gif(str(final_output_path), fps=fps, loop=True)
-        else:
-            clip.write_videofile(str(final_output_path), codec="libx264")
-        clip.close()
+                    # Each frame goes to ffmpeg's stdin as soon as it is ready
+                    _write_mp4(
+                        final_output_path, iterator, (width, viewport_height), fps)
+            finally:
+                if use_progress and hasattr(iterator, "close"):
+                    iterator.close()
+                rendered.close()
+
+        if frames_dir is not None:
+            print(f"Kept {frame_count} frame PNGs in {frames_dir}")
         if final_output_path != desired_output:
             requested = config.output or desired_default
             print(
@@ -647,16 +864,3 @@ def generate_scrolling_stars(config: StarsAnimationConfig) -> str:
         return str(final_output_path)
     finally:
         session.close()
-        if config.cleanup_frames:
-            for path in frame_files:
-                try:
-                    os.remove(path)
-                except FileNotFoundError:
-                    pass
-            if created_temp_dir:
-                shutil.rmtree(frames_dir, ignore_errors=True)
-            else:
-                try:
-                    os.rmdir(frames_dir)
-                except OSError:
-                    pass
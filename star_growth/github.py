@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: a much faster parser for large stargazer pages
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from .config import StarsAnimationConfig
 
 _RATE_LIMIT_STATUS = 403
 _TRANSIENT_STATUSES = {500, 502, 503, 504}
+_MAX_PER_PAGE = 100
+_MAX_PAGE_WORKERS = 8
 
 
 class GitHubAPIError(RuntimeError):
@@ -25,6 +37,41 @@ def _augment_headers(config: StarsAnimationConfig, headers: Dict[str, str] | Non
     return merged
 
 
+class _ReportingRetry(Retry):
+    """urllib3 ``Retry`` that announces each retry before it waits."""
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        # Raises MaxRetryError once the budget is spent, so only real retries
+        # reach the messages below
+        new_retry = super().increment(
+            method, url, response, error, _pool, _stacktrace)
+        wait_seconds = new_retry.get_backoff_time()
+        if response is not None and error is None:
+            retry_after = new_retry.get_retry_after(response)
+            if retry_after is not None and new_retry.respect_retry_after_header:
+                wait_seconds = retry_after
+            print(
+                f"GitHub transient error {response.status}; retrying in {wait_seconds:.1f}s...")
+        else:
+            print(f"Request error {error}; retrying in {wait_seconds:.1f}s...")
+        return new_retry
+
+
+def _mount_retry_adapter(session: requests.Session, config: StarsAnimationConfig) -> None:
+    """Let urllib3 retry connection errors and transient 5xx responses."""
+
+    retries = _ReportingRetry(
+        # max_retries counts attempts, urllib3 counts retries after the first
+        total=max(0, config.max_retries - 1),
+        backoff_factor=config.retry_backoff,
+        status_forcelist=sorted(_TRANSIENT_STATUSES),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retries))
+
+
 def _request_with_retry(
     session: requests.Session,
     method: str,
@@ -37,6 +84,8 @@ def _request_with_retry(
     attempt = 0
     headers = _augment_headers(config, headers)
 
+    # Transport retries happen in the mounted adapter; this loop only waits
+    # out GitHub's rate limit, which is reported as a plain 403.
     while True:
         attempt += 1
         try:
@@ -48,12 +97,7 @@ def _request_with_retry(
                 timeout=config.request_timeout,
             )
         except requests.RequestException as exc:
-            if attempt >= config.max_retries:
-                raise GitHubAPIError(f"GitHub request failed: {exc}") from exc
-            sleep_seconds = config.retry_backoff * attempt
-            print(f"Request error {exc}; retrying in {sleep_seconds:.1f}s...")
-            time.sleep(sleep_seconds)
-            continue
+            raise GitHubAPIError(f"GitHub request failed: {exc}") from exc
 
         if response.status_code == _RATE_LIMIT_STATUS and response.headers.get("X-RateLimit-Remaining") == "0":
             reset_at = response.headers.get("X-RateLimit-Reset")
@@ -68,13 +112,6 @@ def _request_with_retry(
             time.sleep(max(wait_seconds, 1.0))
             continue
 
-        if response.status_code in _TRANSIENT_STATUSES and attempt < config.max_retries:
-            sleep_seconds = config.retry_backoff * attempt
-            print(
-                f"GitHub transient error {response.status_code}; retrying in {sleep_seconds:.1f}s...")
-            time.sleep(sleep_seconds)
-            continue
-
         if response.status_code >= 400:
             raise GitHubAPIError(
                 f"GitHub request to {url} failed with status {response.status_code}: {response.text[:200]}"
@@ -84,22 +121,39 @@ def _request_with_retry(
 
 
 def fetch_repo_and_stargazers(session: requests.Session, config: StarsAnimationConfig) -> Tuple[int, List[dict]]:
+    _mount_retry_adapter(session, config)
     repo_url = f"https://api.github.com/repos/{config.owner}/{config.repo}"
     repo_resp = _request_with_retry(session, "GET", repo_url, config)
-    repo_json = repo_resp.json()
+    repo_json = _json_loads(repo_resp.content)
     current_stars = int(repo_json.get("stargazers_count", 0))
 
     stargazers: List[dict] = []
     sg_url = f"https://api.github.com/repos/{config.owner}/{config.repo}/stargazers"
-    params = {
-        "per_page": str(config.max_entries),
-        "sort": "created",
-        "direction": "desc",
-    }
     headers = {"Accept": "application/vnd.github.v3.star+json"}
-    sg_resp = _request_with_retry(
-        session, "GET", sg_url, config, headers=headers, params=params)
-    for item in sg_resp.json():
+    wanted = max(1, config.max_entries)
+    per_page = min(wanted, _MAX_PER_PAGE)
+    page_count = math.ceil(wanted / per_page)
+
+    def fetch_page(page: int) -> list:
+        params = {
+            "per_page": str(per_page),
+            "page": str(page),
+            "sort": "created",
+            "direction": "desc",
+        }
+        return _json_loads(_request_with_retry(
+            session, "GET", sg_url, config, headers=headers, params=params).content)
+
+    if page_count == 1:
+        payloads = [fetch_page(1)]
+    else:
+        # GitHub caps per_page at 100; fetch the pages in parallel over the
+        # pooled session and keep them in page order
+        with ThreadPoolExecutor(max_workers=min(page_count, _MAX_PAGE_WORKERS)) as executor:
+            payloads = list(executor.map(fetch_page, range(1, page_count + 1)))
+
+    items = [item for payload in payloads for item in payload][:wanted]
+    for item in items:
         if isinstance(item, dict) and "user" in item:
             user = item["user"]
             login = user.get("login")
@@ -0,0 +1,32 @@
+import dataclasses
+
+import pytest
+
+from star_growth.config import StarsAnimationConfig
+
+
+@pytest.fixture(scope="session")
+def config_factory():
+    # Build the defaults once, but hand every test its own instance:
+    # cached properties such as auth_token and frames_directory must not leak
+    # between tests. dataclasses.replace reruns __post_init__ on overrides.
+    template = StarsAnimationConfig()
+
+    def _factory(**overrides):
+        return dataclasses.replace(template, **overrides)
+
+    return _factory
+
+
+@pytest.fixture(scope="module")
+def io_root(tmp_path_factory):
+    return tmp_path_factory.mktemp("star_growth_io")
+
+
+@pytest.fixture
+def isolated_dir(io_root, request):
+    # One subdirectory per test under a module-wide root, instead of a fresh
+    # tmp_path tree for every test
+    path = io_root / request.node.name
+    path.mkdir()
+    return path
@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from star_growth import cli, generator
+
+
+@pytest.fixture
+def captured_config(monkeypatch):
+    captured = {}
+
+    def fake_generate(config):
+        captured["config"] = config
+        return config.output
+
+    monkeypatch.setattr(generator, "generate_scrolling_stars", fake_generate)
+    return captured
+
+
+def test_main_parses_plain_dates_as_full_days(captured_config):
+    cli.main(["-s", "2024-01-02", "-E", "2024-01-03"])
+
+    config = captured_config["config"]
+    assert config.start_datetime == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert config.end_datetime == datetime(
+        2024, 1, 3, 23, 59, 59, 999999, tzinfo=timezone.utc)
+
+
+def test_main_converts_offset_timestamps_to_utc(captured_config):
+    cli.main(["--end-date", "2024-01-03T12:30:00+02:00"])
+
+    config = captured_config["config"]
+    assert config.end_datetime == datetime(
+        2024, 1, 3, 10, 30, tzinfo=timezone.utc)
+
+
+def test_main_rejects_invalid_date(captured_config):
+    with pytest.raises(SystemExit):
+        cli.main(["--start-date", "2024-13-45"])
+
+    assert "config" not in captured_config
+
+
+def test_main_rejects_inverted_range(captured_config):
+    with pytest.raises(SystemExit):
+        cli.main(["-s", "2024-02-01", "-E", "2024-01-01"])
+
+
+def test_main_accepts_zulu_timestamps(captured_config):
+    cli.main(["--start-date", "2024-01-03T08:15:30.5Z"])
+
+    config = captured_config["config"]
+    assert config.start_datetime == datetime(
+        2024, 1, 3, 8, 15, 30, 500000, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "argv, takes_fast_path",
+    [
+        ([], True),
+        (["--owner", "octocat", "--repo", "Hello-World"], True),
+        (["-u", "octocat", "-r", "Hello-World", "-o", "out.gif", "-t", "Stars"],
+         True),
+        (["--owner", "octocat", "--fps", "30"], False),
+        (["--owner", "-u"], False),
+    ],
+)
+def test_fast_parse_matches_argparse(argv, takes_fast_path):
+    fast = cli._fast_parse(argv)
+
+    if takes_fast_path:
+        assert fast is not None
+        assert fast == cli.build_arg_parser().parse_args(argv)
+    else:
+        assert fast is None
+
+
+def test_fast_parse_defers_unknown_flags():
+    assert cli._fast_parse(["--owner", "octocat", "--fps", "30"]) is None
+    assert cli._fast_parse(["--help"]) is None
+
+
+def test_main_version_skips_full_parser(monkeypatch, capsys):
+    def fail():
+        raise AssertionError("full parser should not be built")
+
+    monkeypatch.setattr(cli, "build_arg_parser", fail)
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["--owner", "octocat", "--version"])
+
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out.strip() == f"star-growth {cli.__version__}"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-02T10", datetime(2024, 1, 2, 10)),
+        ("2024-01-02 10:15", datetime(2024, 1, 2, 10, 15)),
+        ("2024-01-02t10:15:30.123", datetime(2024, 1, 2, 10, 15, 30, 123000)),
+        ("2024-01-02T10:00Z", datetime(2024, 1, 2, 10)),
+        ("2024-01-02T10:00-00:00", datetime(2024, 1, 2, 10)),
+        ("2024-01-02T10+05:00", datetime(2024, 1, 2, 5)),
+        ("2024-01-02T10:00+05", datetime(2024, 1, 2, 5)),
+        ("2024-01-02T10:00+0530", datetime(2024, 1, 2, 4, 30)),
+        ("2024-01-02T10:00:00+05:30:00", datetime(2024, 1, 2, 4, 30)),
+        ("2024-01-02T10:00:00+05:30:15.5",
+         datetime(2024, 1, 2, 4, 29, 44, 500000)),
+    ],
+)
+def test_parse_date_accepts_iso_8601(value, expected):
+    assert cli._parse_date(value) == expected.replace(tzinfo=timezone.utc)
+
+
+def test_parse_date_offset_matches_fromisoformat():
+    value = "2024-01-02T10:00:00-03:45"
+
+    assert cli._parse_date(value) == datetime.fromisoformat(value)
+    assert cli._parse_date(value).utcoffset() == timedelta(0)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024/01/02T00:00",
+        "2024-01-02T10:00+05:99",
+        "2024-01-02T10:00+05:30:60",
+        "2024-01-02T10:00+24:00",
+        "2024-01-02T10:60",
+        "2024-01-02T10:00:00.1234567",
+        "2024-01-02x10:00",
+        "2024-01-02T\N{ARABIC-INDIC DIGIT ONE}0:00",
+        "2024-02-30",
+        "2024-+1-02",
+        "2024- 1-02",
+        "+024-01-02",
+        "2024-01-\N{ARABIC-INDIC DIGIT TWO}2",
+    ],
+)
+def test_parse_date_rejects_malformed_values(value):
+    with pytest.raises(ValueError):
+        cli._parse_date(value)
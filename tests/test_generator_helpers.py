@@ -1,21 +1,29 @@
+import dataclasses
 import os
-from datetime import datetime, timezone
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 import pytest
+from PIL import Image, ImageDraw
 
 from star_growth import generator
 from star_growth.config import StarsAnimationConfig
-
-
-@pytest.fixture
-def config_factory():
-    def _factory(**overrides):
-        config = StarsAnimationConfig()
-        for key, value in overrides.items():
-            setattr(config, key, value)
-        return config
-
-    return _factory
+from star_growth.generator import (
+    BG_BOTTOM,
+    BG_TOP,
+    DEFAULT_OUTPUT_NAME,
+    prefetch_avatars,
+    resolve_output_path,
+    vertical_gradient,
+    vignette_gradient,
+    _filter_stargazers_by_date,
+    _final_star_count,
+    _ordered_map,
+    _parse_github_timestamp,
+    _unique_output_path,
+    _write_mp4,
+)
 
 
 def test_config_factory_defaults_show_progress(config_factory):
@@ -24,86 +32,130 @@ def test_config_factory_defaults_show_progress(config_factory):
     assert config.show_progress is True
 
 
-def test_final_star_count_clamps_negative():
-    assert generator._final_star_count(-50) == 0
+def test_config_factory_returns_fresh_instances(config_factory, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "first")
+    assert config_factory().auth_token == "first"
 
+    monkeypatch.setenv("GITHUB_TOKEN", "second")
+    assert config_factory().auth_token == "second"
 
-def test_final_star_count_returns_positive():
-    assert generator._final_star_count(120) == 120
 
+def test_config_normalizes_format_and_workers():
+    config = StarsAnimationConfig(output_format="GIF", avatar_workers=0)
 
-def test_resolve_output_path_adds_extension(tmp_path, config_factory):
-    config = config_factory(output=str(tmp_path / "video_output"))
+    assert config.output_format == "gif"
+    assert config.normalized_output_format == "gif"
+    assert config.avatar_worker_count == 1
 
-    resolved = generator.resolve_output_path(config)
 
-    assert resolved == tmp_path / "video_output.mp4"
-    assert resolved.suffix == ".mp4"
-    assert config.output_format == "mp4"
+def test_config_normalizes_date_bounds_to_utc():
+    offset = timezone(timedelta(hours=2))
+    config = StarsAnimationConfig(
+        start_datetime=datetime(2024, 1, 2),
+        end_datetime=datetime(2024, 1, 3, 12, tzinfo=offset),
+    )
 
+    assert config.start_at_utc == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert config.end_at_utc.tzinfo is timezone.utc
+    assert config.end_at_utc.hour == 10
+    assert config.start_epoch == config.start_at_utc.timestamp()
+    assert config.end_epoch == config.end_at_utc.timestamp()
 
-def test_resolve_output_path_supports_gif(tmp_path, config_factory):
-    config = config_factory(output=str(
-        tmp_path / "preview"), output_format="gif")
 
-    resolved = generator.resolve_output_path(config)
+def test_config_is_frozen_and_hashable():
+    config = StarsAnimationConfig()
 
-    assert resolved.suffix == ".gif"
-    assert config.output_format == "gif"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.fps = 60
 
+    assert hash(config) == hash(StarsAnimationConfig())
 
-def test_resolve_output_path_infers_format_from_extension(tmp_path, config_factory):
-    config = config_factory(output=str(tmp_path / "custom.gif"))
 
-    resolved = generator.resolve_output_path(config)
+@pytest.mark.parametrize(
+    "value, expected",
+    [(-50, 0), (0, 0), (120, 120)],
+)
+def test_final_star_count(value, expected):
+    assert _final_star_count(value) == expected
 
-    assert resolved.name == "custom.gif"
-    assert config.output_format == "gif"
 
+@pytest.mark.parametrize(
+    "output_name, overrides, expected_name",
+    [
+        ("video_output", {}, "video_output.mp4"),
+        ("preview", {"output_format": "gif"}, "preview.gif"),
+        ("custom.gif", {}, "custom.gif"),
+    ],
+    ids=["adds-extension", "supports-gif", "infers-format-from-extension"],
+)
+def test_resolve_output_path_naming(
+        isolated_dir, config_factory, output_name, overrides, expected_name):
+    config = config_factory(
+        output=str(isolated_dir / output_name), **overrides)
 
-def test_resolve_output_path_directory_hint(tmp_path, config_factory):
-    target_dir = tmp_path / "exports" / "nested"
-    config = config_factory(output=str(target_dir) + os.sep)
+    resolved = resolve_output_path(config)
 
-    resolved = generator.resolve_output_path(config)
+    assert resolved == isolated_dir / expected_name
 
-    assert resolved == target_dir / generator.DEFAULT_OUTPUT_NAME
+
+def test_resolve_output_path_directory_hint(isolated_dir, config_factory):
+    target_dir = isolated_dir / "exports" / "nested"
+    config = config_factory(output=target_dir)
+
+    resolved = resolve_output_path(config, directory_hint=True)
+
+    assert resolved == target_dir / DEFAULT_OUTPUT_NAME
     assert resolved.parent.exists()
 
 
-def test_resolve_output_path_collision(tmp_path, config_factory):
-    desired = tmp_path / "clip.mp4"
+def test_resolve_output_path_trailing_separator_is_directory_hint(
+        isolated_dir, config_factory):
+    config = config_factory(output=str(isolated_dir / "exports") + os.sep)
+
+    resolved = resolve_output_path(config)
+
+    assert resolved == isolated_dir / "exports" / DEFAULT_OUTPUT_NAME
+
+
+def test_resolve_output_path_collision(isolated_dir, config_factory):
+    desired = isolated_dir / "clip.mp4"
     desired.parent.mkdir(parents=True, exist_ok=True)
     desired.touch()
 
     config = config_factory(output=str(desired))
 
-    resolved = generator.resolve_output_path(config)
+    resolved = resolve_output_path(config)
 
     assert resolved != desired
     assert resolved.name == "clip (1).mp4"
     assert not resolved.exists()
 
 
-def test_unique_output_path_handles_multiple_suffixes(tmp_path):
-    base = tmp_path / "archive.tar.gz"
+@pytest.mark.parametrize("taken", [1, 5, 50])
+def test_unique_output_path_handles_multiple_suffixes(isolated_dir, taken):
+    base = isolated_dir / "archive.tar.gz"
     base.touch()
-    (tmp_path / "archive (1).tar.gz").touch()
+    for idx in range(1, taken + 1):
+        (isolated_dir / f"archive ({idx}).tar.gz").touch()
 
-    candidate = generator._unique_output_path(base)
+    candidate = _unique_output_path(base)
 
-    assert candidate.name == "archive (2).tar.gz"
+    assert candidate.name == f"archive ({taken + 1}).tar.gz"
 
 
-def test_prefetch_avatars_deduplicates(monkeypatch, config_factory):
+@pytest.fixture
+def fake_downloader(monkeypatch):
     calls = []
 
-    def fake_download(url, timeout):
+    def fake_download(session, url, timeout):
         calls.append((url, timeout))
         return f"image-{url}"
 
     monkeypatch.setattr(generator, "_download_avatar", fake_download)
+    return calls
 
+
+def test_prefetch_avatars_deduplicates(fake_downloader, config_factory):
     urls = [
         "https://avatars.com/a.png",
         "https://avatars.com/b.png",
@@ -112,24 +164,24 @@ def test_prefetch_avatars_deduplicates(monkeypatch, config_factory):
     ]
     config = config_factory(avatar_workers=4)
 
-    cache = generator.prefetch_avatars(urls, config)
+    cache = prefetch_avatars(urls, config)
 
     assert cache["https://avatars.com/a.png"] == "image-https://avatars.com/a.png"
     assert cache["https://avatars.com/b.png"] == "image-https://avatars.com/b.png"
     assert None not in cache
-    assert [call[0] for call in calls] == [
+    # Downloads run concurrently, so only the set of fetched URLs is fixed
+    assert len(fake_downloader) == 2
+    assert Counter(url for url, _ in fake_downloader) == Counter([
         "https://avatars.com/a.png",
         "https://avatars.com/b.png",
-    ]
+    ])
 
 
-def test_prefetch_avatars_handles_empty(monkeypatch, config_factory):
-    monkeypatch.setattr(generator, "_download_avatar",
-                        lambda url, timeout: "x")
-
-    cache = generator.prefetch_avatars([], config_factory())
+def test_prefetch_avatars_handles_empty(fake_downloader, config_factory):
+    cache = prefetch_avatars([], config_factory())
 
     assert cache == {}
+    assert fake_downloader == []
 
 
 def test_filter_stargazers_by_date_inclusive():
@@ -141,11 +193,26 @@ def test_filter_stargazers_by_date_inclusive():
     start = datetime(2024, 1, 2, tzinfo=timezone.utc)
     end = datetime(2024, 1, 3, 23, 59, 59, tzinfo=timezone.utc)
 
-    filtered = generator._filter_stargazers_by_date(stargazers, start, end)
+    filtered = _filter_stargazers_by_date(
+        stargazers, start.timestamp(), end.timestamp())
 
     assert [sg["login"] for sg in filtered] == ["mid"]
 
 
+def test_filter_stargazers_by_date_skips_missing_timestamps():
+    stargazers = [
+        {"login": "missing", "starred_at": None},
+        {"login": "edge", "starred_at": "2024-01-03T23:59:59Z"},
+        {"login": "late", "starred_at": "2024-01-04T00:00:00Z"},
+    ]
+    end = datetime(2024, 1, 3, 23, 59, 59, 999999, tzinfo=timezone.utc)
+
+    filtered = _filter_stargazers_by_date(
+        stargazers, None, end.timestamp())
+
+    assert [sg["login"] for sg in filtered] == ["edge"]
+
+
 def test_filter_stargazers_by_date_ignores_unparseable_when_filtered():
     stargazers = [
         {"login": "bad", "starred_at": "invalid"},
@@ -153,6 +220,77 @@ def test_filter_stargazers_by_date_ignores_unparseable_when_filtered():
     ]
     start = datetime(2024, 1, 4, tzinfo=timezone.utc)
 
-    filtered = generator._filter_stargazers_by_date(stargazers, start, None)
+    filtered = _filter_stargazers_by_date(
+        stargazers, start.timestamp(), None)
 
     assert [sg["login"] for sg in filtered] == ["keep"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-02T03:04:05Z", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2024-01-02T03:04:05.250000Z",
+         datetime(2024, 1, 2, 3, 4, 5, 250000, tzinfo=timezone.utc)),
+        ("2024-13-02T03:04:05Z", None),
+        ("invalid", None),
+        (None, None),
+    ],
+)
+def test_parse_github_timestamp(value, expected):
+    assert _parse_github_timestamp(value) == expected
+
+
+def test_vignette_gradient_matches_composited_vignette():
+    size = (301, 57)
+    width, height = size
+    expected = vertical_gradient(
+        size, BG_TOP, BG_BOTTOM)
+    vignette = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(vignette)
+    draw.rectangle([0, 0, width, height], fill=(0, 0, 0, 110))
+    draw.ellipse([-width * 0.4, -height * 0.6, width * 1.4, height * 1.6],
+                 fill=(0, 0, 0, 30))
+    expected = Image.alpha_composite(expected, vignette)
+
+    fused = vignette_gradient(
+        size, BG_TOP, BG_BOTTOM)
+
+    assert fused.tobytes() == expected.tobytes()
+
+
+def test_ordered_map_keeps_order_and_bounds_in_flight():
+    pulled = []
+
+    def items():
+        for idx in range(10):
+            pulled.append(idx)
+            yield idx
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = _ordered_map(executor, lambda idx: idx * 2, items(), window=3)
+        assert next(results) == 0
+        assert len(pulled) <= 3
+        assert list(results) == [idx * 2 for idx in range(1, 10)]
+
+
+@pytest.mark.parametrize(
+    "size, pix_fmt",
+    [((940, 520), "yuv420p"), ((941, 520), "yuv444p"), ((940, 301), "yuv444p")],
+)
+def test_write_mp4_keeps_frame_size(monkeypatch, size, pix_fmt):
+    captured = {}
+
+    def fake_write_frames(path, frame_size, **kwargs):
+        captured.update(kwargs, size=frame_size)
+        while (yield) is not None:
+            pass
+
+    monkeypatch.setattr(generator.imageio_ffmpeg, "write_frames",
+                        fake_write_frames)
+
+    _write_mp4("out.mp4", [], size, fps=24)
+
+    assert captured["size"] == size
+    assert captured["pix_fmt_out"] == pix_fmt
+    assert captured["macro_block_size"] == 1
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
+
+from star_growth import github
+from star_growth.config import StarsAnimationConfig
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+    text = ""
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+class FakeSession:
+    def __init__(self, stargazer_total):
+        self.stargazer_total = stargazer_total
+        self.pages = []
+        self.adapters = {}
+
+    def mount(self, prefix, adapter):
+        self.adapters[prefix] = adapter
+
+    def request(self, method, url, headers=None, params=None, timeout=None):
+        if not url.endswith("/stargazers"):
+            return FakeResponse({"stargazers_count": self.stargazer_total})
+        page, per_page = int(params["page"]), int(params["per_page"])
+        self.pages.append((page, per_page))
+        first = (page - 1) * per_page
+        last = min(self.stargazer_total, first + per_page)
+        return FakeResponse([
+            {
+                "starred_at": f"2024-01-01T00:00:{idx % 60:02d}Z",
+                "user": {"login": f"user{idx}", "avatar_url": None},
+            }
+            for idx in range(first, last)
+        ])
+
+
+def test_fetch_single_page_when_under_limit():
+    session = FakeSession(stargazer_total=500)
+
+    stars, stargazers = github.fetch_repo_and_stargazers(
+        session, StarsAnimationConfig(max_entries=30))
+
+    assert stars == 500
+    assert session.pages == [(1, 30)]
+    assert len(stargazers) == 30
+
+
+def test_fetch_paginates_past_github_page_cap():
+    session = FakeSession(stargazer_total=500)
+
+    _, stargazers = github.fetch_repo_and_stargazers(
+        session, StarsAnimationConfig(max_entries=250))
+
+    assert sorted(session.pages) == [(1, 100), (2, 100), (3, 100)]
+    assert len(stargazers) == 250
+    assert {sg["login"] for sg in stargazers} == {
+        f"user{idx}" for idx in range(250)}
+
+
+def test_fetch_mounts_retrying_adapter():
+    session = FakeSession(stargazer_total=1)
+
+    github.fetch_repo_and_stargazers(
+        session, StarsAnimationConfig(max_retries=4, retry_backoff=1.5))
+
+    retries = session.adapters["https://"].max_retries
+    assert retries.total == 3
+    assert retries.backoff_factor == 1.5
+    assert set(retries.status_forcelist) == {500, 502, 503, 504}
+    assert retries.respect_retry_after_header
+    assert not retries.raise_on_status
+
+
+def test_retry_reports_transient_errors(capsys):
+    retries = github._ReportingRetry(
+        total=2, backoff_factor=2, status_forcelist=[503])
+    response = HTTPResponse(status=503)
+
+    retries = retries.increment("GET", "/repos", response=response)
+    retries = retries.increment("GET", "/repos", response=response)
+
+    assert capsys.readouterr().out.splitlines() == [
+        "GitHub transient error 503; retrying in 0.0s...",
+        "GitHub transient error 503; retrying in 4.0s...",
+    ]
+    with pytest.raises(MaxRetryError):
+        retries.increment("GET", "/repos", response=response)